@@ -13,6 +13,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/erhan1209/orangic-python",
     packages=find_packages(),
+    package_data={"orangic": ["py.typed"]},
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",  # Changed to Pre-Alpha
         "Intended Audience :: Developers",